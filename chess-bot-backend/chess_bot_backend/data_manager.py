@@ -79,10 +79,10 @@ class DataManager:
         
         try:
             subprocess.run(cmd, check=True)
-            logger.info(f"Database exported to {output_path}")
+            logger.info("Database exported to %s", output_path)
             return str(output_path)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to export database: {e}")
+            logger.error("Failed to export database: %s", e)
             raise
             
     def export_game_data(self, db_url: str, game_ids: List[int], filepath: Optional[Union[str, Path]] = None) -> str:
@@ -124,10 +124,10 @@ class DataManager:
         
         try:
             subprocess.run(cmd, check=True)
-            logger.info(f"Game data exported to {output_path}")
+            logger.info("Game data exported to %s", output_path)
             return str(output_path)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to export game data: {e}")
+            logger.error("Failed to export game data: %s", e)
             raise
             
     def import_data(self, db_url: str, filepath: Union[str, Path]) -> None:
@@ -152,9 +152,9 @@ class DataManager:
         
         try:
             subprocess.run(cmd, check=True)
-            logger.info(f"Data imported from {filepath}")
+            logger.info("Data imported from %s", filepath)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to import data: {e}")
+            logger.error("Failed to import data: %s", e)
             raise
             
     def get_completed_games(self, session: Session) -> Sequence[Game]:
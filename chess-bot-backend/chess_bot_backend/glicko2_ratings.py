@@ -127,9 +127,10 @@ CONVERGENCE_TOLERANCE = 0.000001
 
 # Mathematical constants
 PI_SQUARED = math.pi ** 2
+G_FACTOR = 3.0 / PI_SQUARED  # 3/π² term of g(φ), folded once at import
 SCALE_FACTOR = 400.0  # Used in E function for logistic curve scaling
 
-@dataclass
+@dataclass(slots=True)
 class GlickoRating:
     rating: float  # μ (mu) - Player's rating
     rd: float     # φ (phi) - Rating deviation
@@ -155,6 +156,7 @@ class Glicko2:
     
     Uses the standard Glicko-2 scale (μ=1500, φ=350, σ=0.06, τ=0.5).
     """
+    __slots__ = ('tau',)
     
     def __init__(self, tau: float = 0.5):
         self.tau = tau  # system constant, constrains volatility change
@@ -165,9 +167,9 @@ class Glicko2:
         
         Formula: g(φ) = 1 / sqrt(1 + 3φ²/π²)
         """
-        return 1.0 / math.sqrt(1 + (3 * rd**2) / PI_SQUARED)
+        return 1.0 / math.sqrt(1 + G_FACTOR * rd * rd)
         
-    def _E(self, rating: float, opp_r: float, opp_rd: float) -> float:
+    def _E(self, rating: float, opp_r: float, g_phi: float) -> float:
         """
         Expected score E(μ,μj,φj) against an opponent.
         
@@ -176,22 +178,32 @@ class Glicko2:
         Args:
             rating: Player's rating (μ)
             opp_r: Opponent's rating (μj)
-            opp_rd: Opponent's rating deviation (φj)
+            g_phi: Scale factor g(φj) of the opponent's rating deviation
         """
-        g_phi = self._g(opp_rd)
         rating_diff = rating - opp_r
         return 1.0 / (1 + math.exp(-g_phi * rating_diff / SCALE_FACTOR))
         
-    def _v_inv(self, rating: float, results: list[GameResult]) -> float:
+    def _opponent_terms(self, rating: float, results: list[GameResult]) -> list[tuple[float, float, float]]:
+        """
+        Compute (g(φj), E(μ,μj,φj), sj) once per game result.
+        
+        Steps 1, 2 and 5 of the update all need g and E for every opponent,
+        so they are evaluated once here and shared.
+        """
+        terms = []
+        for opp_r, opp_rd, score in results:
+            g_phi = self._g(opp_rd)
+            terms.append((g_phi, self._E(rating, opp_r, g_phi), score))
+        return terms
+        
+    def _v_inv(self, terms: list[tuple[float, float, float]]) -> float:
         """
         Compute inverse of estimated variance v⁻¹ of rating based on game outcomes.
         
         Formula: v⁻¹ = Σ[g(φj)² * E(μ,μj,φj) * (1 - E(μ,μj,φj))]
         """
         variance_sum = 0.0
-        for opp_r, opp_rd, _ in results:
-            E = self._E(rating, opp_r, opp_rd)
-            g_phi = self._g(opp_rd)
+        for g_phi, E, _ in terms:
             variance_sum += (g_phi**2) * E * (1 - E)
         return variance_sum
         
@@ -214,14 +226,14 @@ class Glicko2:
                 vol=rating.vol
             )
             
+        terms = self._opponent_terms(rating.rating, results)
+        
         # Step 1: Calculate variance
-        v = 1.0 / self._v_inv(rating.rating, results)
+        v = 1.0 / self._v_inv(terms)
         
-        # Step 2: Calculate improvement
-        delta = v * sum(
-            self._g(opp_rd) * (score - self._E(rating.rating, opp_r, opp_rd))
-            for opp_r, opp_rd, score in results
-        )
+        # Step 2: Calculate improvement (the same sum drives step 5)
+        score_sum = sum(g_phi * (score - E) for g_phi, E, score in terms)
+        delta = v * score_sum
         
         # Step 3: Update volatility
         vol_new = self._update_volatility(rating, v, delta)
@@ -231,10 +243,7 @@ class Glicko2:
         rd_new = 1.0 / math.sqrt(1.0/rd_star**2 + 1.0/v)
         
         # Step 5: Update rating
-        rating_new = rating.rating + (rd_new**2 * sum(
-            self._g(opp_rd) * (score - self._E(rating.rating, opp_r, opp_rd))
-            for opp_r, opp_rd, score in results
-        ))
+        rating_new = rating.rating + rd_new**2 * score_sum
         
         return GlickoRating(
             rating=rating_new,
@@ -31,19 +31,22 @@ Implementation Notes:
 -------------------
 - Each model should be treated as a separate player for rating purposes
 - Models use different temperatures/configurations for varied play styles
-- Response parsing is handled by a dedicated Claude model for consistency
+- Responses naming a single legal UCI move are parsed directly; anything
+  ambiguous is handed to a dedicated Claude model for consistency
 - Moves are validated against legal moves before being returned
 """
 
+import re
 import chess
 import chess.pgn
-from tenacity import retry, stop_after_attempt, wait_fixed
-from langchain_openai import ChatOpenAI
-from langchain_deepseek import ChatDeepSeek
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_anthropic import ChatAnthropic
-from langchain.chat_models.base import BaseChatModel
-from typing import Dict, List, Tuple
+from tenacity import retry, stop_after_attempt, wait_random_exponential
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from langchain.chat_models.base import BaseChatModel
+
+# Candidate UCI moves in free text, e.g. 'e2e4' or 'e7e8q'
+UCI_MOVE_PATTERN = re.compile(r'\b[a-h][1-8][a-h][1-8][qrbn]?\b')
 
 class LLMEngine:
     """
@@ -76,29 +79,48 @@ class LLMEngine:
             "claude-3-opus-latest"
         ]
         
-        # Initialize model instances
-        self.callable_models: Dict[str, BaseChatModel] = {}
-        self._initialize_models()
+        # Model instances are created on first use and reused afterwards
+        self.callable_models: Dict[str, "BaseChatModel"] = {}
         
-    def _initialize_models(self) -> None:
-        """Initialize all supported LLM models."""
-        for model in self.openai_models:
-            self.callable_models[model] = ChatOpenAI(model=model)
-            
-        for model in self.deepseek_models:
-            self.callable_models[model] = ChatDeepSeek(model=model)
-            
-        for model in self.google_models:
-            self.callable_models[model] = ChatGoogleGenerativeAI(model=model)
+    def _get_model(self, model_name: str) -> "BaseChatModel":
+        """
+        Return the chat model for model_name, creating it on first use.
+
+        A tournament only plays a couple of models, so building every client
+        up front wastes startup time. Each client is cached so its HTTP
+        connection pool is reused across moves. Provider SDKs are imported
+        here, so only the providers actually played are ever loaded.
+
+        Raises:
+            ValueError: If model_name is not a supported model
+        """
+        llm = self.callable_models.get(model_name)
+        if llm is not None:
+            return llm
             
-        for model in self.anthropic_models:
-            self.callable_models[model] = ChatAnthropic(
-                model_name=model, 
+        if model_name in self.openai_models:
+            from langchain_openai import ChatOpenAI
+            llm = ChatOpenAI(model=model_name)
+        elif model_name in self.deepseek_models:
+            from langchain_deepseek import ChatDeepSeek
+            llm = ChatDeepSeek(model=model_name)
+        elif model_name in self.google_models:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            llm = ChatGoogleGenerativeAI(model=model_name)
+        elif model_name in self.anthropic_models:
+            from langchain_anthropic import ChatAnthropic
+            llm = ChatAnthropic(
+                model_name=model_name, 
                 timeout=60, 
                 stop=None
             )
+        else:
+            raise ValueError(f"Unsupported model: {model_name}")
+            
+        self.callable_models[model_name] = llm
+        return llm
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(0.1))
+    @retry(stop=stop_after_attempt(3), wait=wait_random_exponential(multiplier=0.25, max=1.0))
     async def get_move(self, board: chess.Board, model_name: str) -> tuple[chess.Move, str]:
         """
         Get the best move from the LLM for the given board position.
@@ -116,16 +138,23 @@ class LLMEngine:
             ValueError: If the model generates an invalid or illegal move
             RuntimeError: If the model fails to generate a move after retries
         """
+        # A forced move needs no analysis; stop after the second legal move
+        # is generated instead of listing them all, and skip the LLM calls
+        legal_moves_iter = iter(board.legal_moves)
+        first_move = next(legal_moves_iter, None)
+        if first_move is not None and next(legal_moves_iter, None) is None:
+            return first_move, "Only legal move"
+        
         # Get current board state
         board_fen = board.fen()
         legal_moves = board.legal_moves
         legal_moves_uci = ', '.join(move.uci() for move in legal_moves)
         
         # Get move history
-        moves_history = []
-        for move in board.move_stack:
-            moves_history.append(move.uci())
-        moves_str = ', '.join(moves_history) if moves_history else "Starting position"
+        if board.move_stack:
+            moves_str = ', '.join(move.uci() for move in board.move_stack)
+        else:
+            moves_str = "Starting position"
         
         # Construct prompt for LLM
         prompt = (
@@ -143,7 +172,7 @@ class LLMEngine:
         )
         
         # Get model and generate move
-        llm = self.callable_models[model_name]
+        llm = self._get_model(model_name)
         message = await llm.ainvoke(prompt)
         message_text = message.content
         assert isinstance(message_text, str)
@@ -157,6 +186,10 @@ class LLMEngine:
         """
         Extract and validate a UCI move from the model's response.
 
+        If the response names exactly one legal move in UCI notation, that move
+        is returned directly. Otherwise a dedicated extraction model is asked
+        to pick the intended move out of the response.
+
         Args:
             response_text: The full response from the LLM
             board: Current chess.Board object for move validation
@@ -167,13 +200,22 @@ class LLMEngine:
         Raises:
             ValueError: If no valid UCI move is found or the move is illegal
         """
+        # Fast path: an unambiguous response needs no extraction round-trip
+        legal_moves_uci = {move.uci() for move in board.legal_moves}
+        candidates = {
+            token for token in UCI_MOVE_PATTERN.findall(response_text.lower())
+            if token in legal_moves_uci
+        }
+        if len(candidates) == 1:
+            return chess.Move.from_uci(candidates.pop())
+        
         extraction_prompt = (
             f"Extract only the chess move in UCI format (e.g. 'e2e4' or 'e7e8q') from this response:\n"
             f"'''{response_text}'''\n"
             "Return only the move, nothing else. If no move is found, return 'NONE'."
         )
         
-        llm = self.callable_models["claude-3-5-sonnet-latest"]
+        llm = self._get_model("claude-3-5-sonnet-latest")
         message = await llm.ainvoke(extraction_prompt)
         message_text = message.content
         assert isinstance(message_text, str)
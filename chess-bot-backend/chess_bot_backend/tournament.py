@@ -13,6 +13,7 @@ import asyncio
 import chess
 import chess.pgn
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Sequence
@@ -36,6 +37,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Termination reasons recorded on finished games. Seventy-five moves and
+# fivefold repetition keep the labels of the draw rules they extend.
+TERMINATION_REASONS: Dict[chess.Termination, str] = {
+    chess.Termination.CHECKMATE: "Checkmate",
+    chess.Termination.STALEMATE: "Stalemate",
+    chess.Termination.INSUFFICIENT_MATERIAL: "Insufficient material",
+    chess.Termination.SEVENTYFIVE_MOVES: "Fifty-move rule",
+    chess.Termination.FIVEFOLD_REPETITION: "Threefold repetition",
+}
+
 class TournamentConfig:
     """Configuration for tournament settings."""
     def __init__(
@@ -89,12 +100,12 @@ class ChessTournament:
         
     def _validate_models(self) -> bool:
         """Check if configured models are available in LLM engine."""
-        all_models = (
-            self.engine.openai_models +
-            self.engine.deepseek_models +
-            self.engine.google_models +
-            self.engine.anthropic_models
-        )
+        all_models = {
+            *self.engine.openai_models,
+            *self.engine.deepseek_models,
+            *self.engine.google_models,
+            *self.engine.anthropic_models
+        }
         return self.config.model1 in all_models and self.config.model2 in all_models
         
     def _init_ratings(self) -> None:
@@ -131,7 +142,7 @@ class ChessTournament:
                 else:
                     white, black = self.config.model2, self.config.model1
                     
-                logger.info(f"Starting game {i+1}/{n}: {white} (White) vs {black} (Black)")
+                logger.info("Starting game %d/%d: %s (White) vs %s (Black)", i + 1, n, white, black)
                 
                 try:
                     game = await self._play_game(white, black)
@@ -140,21 +151,23 @@ class ChessTournament:
                     # Update ratings after each game
                     self._update_ratings(game)
                     
-                    # Export if configured
+                    # Export if configured (pg_dump blocks, keep it off the event loop)
                     if self.config.export_after_game:
-                        self.data_manager.export_game_data(
+                        await asyncio.to_thread(
+                            self.data_manager.export_game_data,
                             self.config.db_url,
                             [game.id]
                         )
                         
                 except Exception as e:
-                    logger.error(f"Error in game {i+1}: {str(e)}")
+                    logger.error("Error in game %d: %s", i + 1, e)
                     continue
                     
         finally:
             # Always export session at end
             if completed_game_ids:
-                self.data_manager.export_game_data(
+                await asyncio.to_thread(
+                    self.data_manager.export_game_data,
                     self.config.db_url,
                     completed_game_ids
                 )
@@ -179,21 +192,24 @@ class ChessTournament:
         self.session.add(game)
         self.session.flush()  # Get game.id
         
+        # Game-over state is computed once per ply and reused for the result
+        outcome = board.outcome()
+        
         try:
-            while not board.is_game_over():
+            while outcome is None:
                 is_white = board.turn
                 current_model = white_model if is_white else black_model
                 
                 # Get move from model
-                move_start = datetime.utcnow()
+                move_start = time.perf_counter()
                 try:
                     chess_move, analysis = await self.engine.get_move(board, current_model)
                 except Exception as e:
-                    logger.error(f"Error getting move: {str(e)}")
+                    logger.error("Error getting move: %s", e)
                     game.termination_reason = f"Error: {str(e)}"
                     break
                     
-                time_taken = (datetime.utcnow() - move_start).total_seconds()
+                time_taken = time.perf_counter() - move_start
                 
                 # Apply move
                 board.push(chess_move)
@@ -210,24 +226,18 @@ class ChessTournament:
                     model_used=current_model
                 )
                 moves.append(move)
+                outcome = board.outcome()
                 
             # Game ended, update final state
             game.moves = moves
             game.num_moves = len(moves)
             game.pgn = str(chess.pgn.Game.from_board(board))
             
-            # Set result
-            if board.is_checkmate():
-                game.result = GameResult.WHITE_WIN if not board.turn else GameResult.BLACK_WIN
-                game.termination_reason = "Checkmate"
-            elif board.is_stalemate():
-                game.termination_reason = "Stalemate"
-            elif board.is_insufficient_material():
-                game.termination_reason = "Insufficient material"
-            elif board.is_fifty_moves():
-                game.termination_reason = "Fifty-move rule"
-            elif board.is_repetition():
-                game.termination_reason = "Threefold repetition"
+            # Set result (outcome is None if the game was aborted by an error)
+            if outcome is not None:
+                if outcome.winner is not None:
+                    game.result = GameResult.WHITE_WIN if outcome.winner else GameResult.BLACK_WIN
+                game.termination_reason = TERMINATION_REASONS[outcome.termination]
             
             self.session.commit()
             return game
@@ -238,13 +248,17 @@ class ChessTournament:
             
     def _update_ratings(self, game: Game) -> None:
         """Update Glicko2 ratings after a game."""
-        # Get current ratings
-        white_rating = self.session.execute(
-            select(Rating).filter_by(model_name=game.white_model)
-        ).scalar_one()
-        black_rating = self.session.execute(
-            select(Rating).filter_by(model_name=game.black_model)
-        ).scalar_one()
+        # Get current ratings for both players in one round-trip
+        ratings = {
+            rating.model_name: rating
+            for rating in self.session.execute(
+                select(Rating).where(
+                    Rating.model_name.in_([game.white_model, game.black_model])
+                )
+            ).scalars()
+        }
+        white_rating = ratings[game.white_model]
+        black_rating = ratings[game.black_model]
         
         # Convert to Glicko ratings
         white_glicko = GlickoRating(